@@ -1,6 +1,12 @@
-import argparse
+import base64
+import binascii
 import csv
+import decimal
+import functools
 import hashlib
+import hmac
+import importlib.util
+import mmap
 import os
 import random
 import sys
@@ -8,91 +14,267 @@ from datetime import datetime
 import tempfile
 import unittest
 
-try:
-    import tkinter as tk
-    from tkinter import messagebox, simpledialog, ttk
-    TK_AVAILABLE = True
-except Exception:
-    TK_AVAILABLE = False
+# tkinter is only imported once the GUI is actually started, so CLI and
+# test runs never load the Tk bindings.
+TK_AVAILABLE = importlib.util.find_spec('tkinter') is not None
+tk = messagebox = simpledialog = ttk = None
+
+def _import_tk() -> bool:
+    global TK_AVAILABLE, tk, messagebox, simpledialog, ttk
+    if tk is None and TK_AVAILABLE:
+        try:
+            import tkinter as tk
+            from tkinter import messagebox, simpledialog, ttk
+        except Exception:
+            TK_AVAILABLE = False
+    return tk is not None
 
 ACCOUNTS_FILE = 'accounts.txt'
 TRANSACTIONS_FILE = 'transactions.txt'
 ADMIN_PASSWORD = 'admin123'
+ACCOUNTS_HEADER = 'AccountNumber,Name,PasswordHash,Balance'
+TRANSACTIONS_HEADER = 'AccountNumber,Type,Amount,DateTime'
+_MENU = '\n'.join(('', '=== Banking System ===', '1. Create Account', '2. Login', '3. Forget Password', '4. Admin Panel', '5. Exit', 'Enter choice: '))
+
+def to_cents(amount) -> int:
+    try:
+        return int(decimal.Decimal(str(amount).strip()).quantize(decimal.Decimal('0.01'), rounding=decimal.ROUND_HALF_UP).scaleb(2))
+    except decimal.InvalidOperation:
+        raise ValueError(f'Invalid amount: {amount!r}') from None
 
-def _write_csv_atomic(path, fieldnames, rows):
+def format_cents(cents: int) -> str:
+    q, r = divmod(abs(cents), 100)
+    return f"{'-' if cents < 0 else ''}{q}.{r:02d}"
+
+def _csv_field(value: str) -> str:
+    if ',' in value or '"' in value or '\n' in value or '\r' in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+def _write_csv_atomic(path, header, lines):
     tmp = path + '.tmp'
-    with open(tmp, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for r in rows:
-            writer.writerow(r)
+    with open(tmp, 'w', newline='', buffering=1 << 20) as f:
+        f.write(header + '\r\n')
+        f.writelines(line + '\r\n' for line in lines)
     os.replace(tmp, path)
 
 def ensure_files(accounts_file=ACCOUNTS_FILE, transactions_file=TRANSACTIONS_FILE):
     if not os.path.exists(accounts_file) or os.path.getsize(accounts_file) == 0:
-        with open(accounts_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=['AccountNumber', 'Name', 'PasswordHash', 'Balance'])
-            writer.writeheader()
-    if not os.path.exists(transactions_file) or os.path.getsize(transactions_file) == 0:
-        with open(transactions_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=['AccountNumber', 'Type', 'Amount', 'DateTime'])
-            writer.writeheader()
+        _write_csv_atomic(accounts_file, ACCOUNTS_HEADER, [])
+    _ensure_transactions_file(transactions_file)
 
-def hash_password(p: str) -> str:
-    return hashlib.sha256(p.encode('utf-8')).hexdigest()
+PASSWORD_SCHEME = 'pbkdf2_sha256$'
+PBKDF2_ITERATIONS = 200_000
+TEMP_PASSWORD_PREFIX = 'temp$'
+
+def _b64(b: bytes) -> str:
+    return base64.b64encode(b).decode('ascii')
+
+def _pwhash(p: str, salt: bytes, iterations: int = PBKDF2_ITERATIONS) -> bytes:
+    return hashlib.pbkdf2_hmac('sha256', p.encode('utf-8'), salt, iterations, 32)
+
+def hash_password(p: str, salt: bytes = None) -> str:
+    salt = salt or os.urandom(16)
+    return f"{PASSWORD_SCHEME}{PBKDF2_ITERATIONS}${_b64(salt)}${_b64(_pwhash(p, salt))}"
+
+@functools.lru_cache(maxsize=1024)
+def _parse_password_hash(stored_hash: str) -> tuple:
+    # (algorithm, iterations, salt, digest) with salt and digest as raw bytes.
+    if stored_hash.startswith(PASSWORD_SCHEME):
+        iterations, salt, digest = stored_hash[len(PASSWORD_SCHEME):].split('$')
+        iterations = int(iterations)
+        # pbkdf2_hmac rejects counts below 1, and a huge one would stall login.
+        if not 0 < iterations <= 10 * PBKDF2_ITERATIONS:
+            raise ValueError('iteration count out of range')
+        return 'pbkdf2', iterations, base64.b64decode(salt, validate=True), base64.b64decode(digest, validate=True)
+    return 'sha256', 0, b'', bytes.fromhex(stored_hash)
+
+def verify_password(stored_hash: str, raw_password: str) -> bool:
+    try:
+        algorithm, iterations, salt, expected = _parse_password_hash(stored_hash)
+    except (binascii.Error, ValueError):
+        return False
+    if algorithm == 'pbkdf2':
+        actual = _pwhash(raw_password, salt, iterations)
+    else:
+        actual = hashlib.sha256(raw_password.encode('utf-8')).digest()
+    return hmac.compare_digest(expected, actual)
+
+def needs_rehash(stored_hash: str) -> bool:
+    try:
+        algorithm, iterations, _, _ = _parse_password_hash(stored_hash)
+    except (binascii.Error, ValueError):
+        return True
+    return algorithm != 'pbkdf2' or iterations != PBKDF2_ITERATIONS
 
-def generate_account_number(existing: dict) -> str:
-    while True:
-        num = str(random.randint(100000, 999999))
+# Free numbers per (low, high) range, built once the range gets crowded and
+# drawn down until empty.
+_free_account_numbers = {}
+
+def generate_account_number(existing: dict, low: int = 100000, high: int = 999999) -> str:
+    for _ in range(32):
+        num = str(random.randint(low, high))
         if num not in existing:
             return num
+    # Random probing keeps missing once the number space is crowded, so
+    # draw straight from the numbers that are still free. The list can go
+    # stale, so it is rebuilt once before giving up.
+    free = _free_account_numbers.setdefault((low, high), [])
+    for rebuilt in (False, True):
+        while free:
+            i = random.randrange(len(free))
+            free[i], free[-1] = free[-1], free[i]
+            num = free.pop()
+            if num not in existing:
+                return num
+        if not rebuilt:
+            free.extend(n for n in map(str, range(low, high + 1)) if n not in existing)
+    raise RuntimeError('No account numbers left')
+
+def _split_account_line(line: bytes) -> list:
+    if b'"' in line:
+        return next(csv.reader([line.decode('utf-8')]))
+    return [field.decode('utf-8') for field in line.rstrip(b'\r\n').split(b',', 3)]
+
+def _file_signature(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
 
 def load_accounts(accounts_file=ACCOUNTS_FILE) -> dict:
+    # Parsed results are shared between loaders (e.g. a CLI and a GUI in the
+    # same process); hand out copies because callers mutate the records.
+    accounts_file = os.path.abspath(accounts_file)
+    accounts = _load_accounts_cached(accounts_file, _file_signature(accounts_file), _file_signature(journal_path(accounts_file)))
+    return {acc: dict(info) for acc, info in accounts.items()}
+
+@functools.lru_cache(maxsize=4)
+def _load_accounts_cached(accounts_file, snapshot_signature, journal_signature) -> dict:
     accounts = {}
-    if not os.path.exists(accounts_file):
+    # Header-only (or empty) snapshots have nothing to parse; mmap also
+    # refuses zero-length files.
+    if not os.path.exists(accounts_file) or os.path.getsize(accounts_file) <= len(ACCOUNTS_HEADER) + 2:
         return accounts
-    with open(accounts_file, 'r', newline='') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if not row.get('AccountNumber'):
+    with open(accounts_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        mm.readline()
+        for line in iter(mm.readline, b''):
+            # A quoted name may itself contain a line break; read on until
+            # the quotes balance so the record is parsed whole.
+            while line.count(b'"') % 2:
+                more = mm.readline()
+                if not more:
+                    break
+                line += more
+            fields = _split_account_line(line)
+            if len(fields) < 4 or not fields[0]:
                 continue
-            acc = row['AccountNumber']
             try:
-                bal = float(row.get('Balance') or 0.0)
-            except Exception:
-                bal = 0.0
-            accounts[acc] = {'name': row.get('Name', ''), 'password': row.get('PasswordHash', ''), 'balance': bal}
+                bal = to_cents(fields[3] or 0)
+            except ValueError:
+                bal = 0
+            accounts[fields[0]] = {'name': fields[1], 'password': fields[2], 'balance': bal}
+    _replay_journal(accounts, accounts_file)
     return accounts
 
 def save_accounts(accounts: dict, accounts_file=ACCOUNTS_FILE):
-    rows = []
-    for acc, info in accounts.items():
-        rows.append({'AccountNumber': acc, 'Name': info.get('name', ''), 'PasswordHash': info.get('password', ''), 'Balance': f"{info.get('balance', 0.0):.2f}"})
-    _write_csv_atomic(accounts_file, ['AccountNumber', 'Name', 'PasswordHash', 'Balance'], rows)
+    lines = [f"{acc},{_csv_field(info.get('name', ''))},{info.get('password', '')},{format_cents(info.get('balance', 0))}" for acc, info in accounts.items()]
+    _write_csv_atomic(accounts_file, ACCOUNTS_HEADER, lines)
+    # The snapshot now includes every journalled balance. Replaying them
+    # again is harmless, so a crash before this truncation loses nothing.
+    journal = journal_path(accounts_file)
+    if os.path.exists(journal):
+        open(journal, 'wb').close()
+    # File timestamps can be too coarse to tell back-to-back writes apart.
+    _load_accounts_cached.cache_clear()
+
+def _timestamp() -> str:
+    # Same 'YYYY-MM-DD HH:MM:SS' text as strftime, without parsing a format.
+    return datetime.now().isoformat(sep=' ', timespec='seconds')
+
+def journal_path(accounts_file=ACCOUNTS_FILE) -> str:
+    return os.path.splitext(accounts_file)[0] + '.journal'
+
+def open_journal(accounts_file=ACCOUNTS_FILE):
+    return open(journal_path(accounts_file), 'ab', buffering=0)
+
+def journal_balances(journal, balances):
+    # Entries hold the new balance rather than a delta, so replaying one onto
+    # a snapshot that already includes it changes nothing.
+    ts = _timestamp()
+    journal.write(''.join(f"{acc},{format_cents(balance)},{ts}\n" for acc, balance in balances).encode('utf-8'))
+    _load_accounts_cached.cache_clear()
+
+def journal_balance(journal, account_number: str, balance: int):
+    journal_balances(journal, [(account_number, balance)])
+
+def _replay_journal(accounts: dict, accounts_file):
+    journal = journal_path(accounts_file)
+    if not os.path.exists(journal):
+        return
+    with open(journal, 'r', newline='', buffering=1 << 20) as f:
+        for line in f:
+            parts = line.rstrip('\r\n').split(',')
+            if len(parts) < 2 or parts[0] not in accounts:
+                continue
+            try:
+                accounts[parts[0]]['balance'] = to_cents(parts[1])
+            except ValueError:
+                continue
 
 def _ensure_transactions_file(transactions_file):
     if not os.path.exists(transactions_file) or os.path.getsize(transactions_file) == 0:
-        with open(transactions_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=['AccountNumber', 'Type', 'Amount', 'DateTime'])
-            writer.writeheader()
+        _write_csv_atomic(transactions_file, TRANSACTIONS_HEADER, [])
 
-def log_transaction(account_number: str, tx_type: str, amount: float, transactions_file=TRANSACTIONS_FILE):
+def open_transaction_log(transactions_file=TRANSACTIONS_FILE) -> int:
     _ensure_transactions_file(transactions_file)
-    with open(transactions_file, 'a', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=['AccountNumber', 'Type', 'Amount', 'DateTime'])
-        writer.writerow({'AccountNumber': account_number, 'Type': tx_type, 'Amount': f"{amount:.2f}", 'DateTime': datetime.now().strftime('%Y-%m-%d %H:%M:%S')})
+    return os.open(transactions_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644)
+
+def write_transactions(log: int, entries) -> list:
+    ts = _timestamp()
+    rows = [(tx_type, format_cents(amount), ts) for _, tx_type, amount in entries]
+    os.write(log, ''.join(f"{entry[0]},{row[0]},{row[1]},{row[2]}\r\n" for entry, row in zip(entries, rows)).encode('utf-8'))
+    return rows
+
+def write_transaction(log: int, account_number: str, tx_type: str, amount: int) -> tuple:
+    return write_transactions(log, [(account_number, tx_type, amount)])[0]
+
+def log_transaction(account_number: str, tx_type: str, amount: int, transactions_file=TRANSACTIONS_FILE):
+    log = open_transaction_log(transactions_file)
+    try:
+        write_transaction(log, account_number, tx_type, amount)
+    finally:
+        os.close(log)
 
 def get_transactions_for_account(account_number: str, transactions_file=TRANSACTIONS_FILE) -> list:
     txs = []
-    if not os.path.exists(transactions_file):
+    if not os.path.exists(transactions_file) or os.path.getsize(transactions_file) <= len(TRANSACTIONS_HEADER) + 2:
         return txs
-    with open(transactions_file, 'r', newline='') as f:
+    with open(transactions_file, 'r', newline='', buffering=1 << 20) as f:
         reader = csv.DictReader(f)
         for row in reader:
             if row.get('AccountNumber') == account_number:
                 txs.append(row)
     return txs
 
+def load_transaction_index(transactions_file=TRANSACTIONS_FILE) -> dict:
+    index = {}
+    if not os.path.exists(transactions_file) or os.path.getsize(transactions_file) <= len(TRANSACTIONS_HEADER) + 2:
+        return index
+    with open(transactions_file, 'r', newline='', buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        for row in reader:
+            if len(row) < 4:
+                continue
+            index.setdefault(row[0], []).append((row[1], row[2], row[3]))
+    return index
+
+def account_summary(accounts: dict) -> tuple:
+    balances = [info['balance'] for info in accounts.values()]
+    return len(balances), sum(balances), max(balances, default=0)
+
 def change_password(accounts: dict, account_number: str, new_password: str, accounts_file=ACCOUNTS_FILE):
     if account_number not in accounts:
         raise KeyError('Account not found')
@@ -110,44 +292,88 @@ def reset_password(accounts: dict, account_number: str, accounts_file=ACCOUNTS_F
     if account_number not in accounts:
         raise KeyError('Account not found')
     temp = f"TEMP{random.randint(1000,9999)}"
-    accounts[account_number]['password'] = hash_password(temp + '_TEMP')
+    accounts[account_number]['password'] = TEMP_PASSWORD_PREFIX + hash_password(temp)
     save_accounts(accounts, accounts_file)
     return temp
 
+def check_password(stored_hash: str, raw_password: str):
+    # Returns 'ok', 'temp' or None with a single key derivation; only the
+    # unprefixed temp records written before PBKDF2 need a second check.
+    if stored_hash.startswith(TEMP_PASSWORD_PREFIX):
+        return 'temp' if verify_password(stored_hash[len(TEMP_PASSWORD_PREFIX):], raw_password) else None
+    if verify_password(stored_hash, raw_password):
+        return 'ok'
+    if not stored_hash.startswith(PASSWORD_SCHEME) and verify_password(stored_hash, raw_password + '_TEMP'):
+        return 'temp'
+    return None
+
 def is_temp_password(stored_hash: str, raw_password: str) -> bool:
-    return stored_hash == hash_password(raw_password + '_TEMP')
+    return check_password(stored_hash, raw_password) == 'temp'
 
-class BankingCLI:
-    def __init__(self, accounts_file=ACCOUNTS_FILE, transactions_file=TRANSACTIONS_FILE):
+class _Ledger:
+    # Account and transaction storage shared by the CLI and the GUI.
+    def open_ledger(self, accounts_file, transactions_file):
         ensure_files(accounts_file, transactions_file)
         self.accounts_file = accounts_file
         self.transactions_file = transactions_file
         self.accounts = load_accounts(self.accounts_file)
+        self._journal = open_journal(self.accounts_file)
+        self._tx_log = open_transaction_log(self.transactions_file)
+        self._tx_index = load_transaction_index(self.transactions_file)
+
+    def record_transaction(self, acc, tx_type, amount):
+        self._tx_index.setdefault(acc, []).append(write_transaction(self._tx_log, acc, tx_type, amount))
+
+    def post_transactions(self, entries):
+        # entries are (account, type, amount, balance delta); a transfer's two
+        # legs go out as one journal write and one log write.
+        balances = {}
+        for acc, _, _, delta in entries:
+            balances[acc] = balances.get(acc, self.accounts[acc]['balance']) + delta
+        journal_balances(self._journal, balances.items())
+        rows = write_transactions(self._tx_log, [(acc, tx_type, amount) for acc, tx_type, amount, _ in entries])
+        for acc, balance in balances.items():
+            self.accounts[acc]['balance'] = balance
+        for (acc, _, _, _), row in zip(entries, rows):
+            self._tx_index.setdefault(acc, []).append(row)
+
+    def compact(self):
+        save_accounts(self.accounts, self.accounts_file)
+
+    def close(self):
+        self.compact()
+        self._journal.close()
+        os.close(self._tx_log)
+
+    def sync(self):
+        os.fsync(self._tx_log)
+        os.fsync(self._journal.fileno())
+
+class BankingCLI(_Ledger):
+    def __init__(self, accounts_file=ACCOUNTS_FILE, transactions_file=TRANSACTIONS_FILE):
+        self.open_ledger(accounts_file, transactions_file)
         self.current_account = None
+        self._dispatch = {'1': self.create_account_cli, '2': self.login_cli, '3': self.forget_password_cli, '4': self.admin_panel_cli}
 
     def main_menu(self):
+        write = sys.stdout.write
+        readline = sys.stdin.readline
         try:
             while True:
-                print('\n=== Banking System ===')
-                print('1. Create Account')
-                print('2. Login')
-                print('3. Forget Password')
-                print('4. Admin Panel')
-                print('5. Exit')
-                choice = input('Enter choice: ').strip()
-                if choice == '1':
-                    self.create_account_cli()
-                elif choice == '2':
-                    self.login_cli()
-                elif choice == '3':
-                    self.forget_password_cli()
-                elif choice == '4':
-                    self.admin_panel_cli()
+                write(_MENU)
+                sys.stdout.flush()
+                line = readline()
+                if not line:
+                    raise EOFError
+                choice = line.strip()
+                handler = self._dispatch.get(choice)
+                if handler:
+                    handler()
                 elif choice == '5':
-                    print('Goodbye!')
+                    write('Goodbye!\n')
                     break
                 else:
-                    print('Invalid choice')
+                    write('Invalid choice\n')
         except (KeyboardInterrupt, EOFError):
             print('\nExiting...')
 
@@ -157,7 +383,7 @@ class BankingCLI:
             print('Name required')
             return
         try:
-            initial_deposit = float(input('Enter initial deposit: ').strip())
+            initial_deposit = to_cents(input('Enter initial deposit: ').strip())
             if initial_deposit < 0:
                 raise ValueError()
         except Exception:
@@ -171,7 +397,7 @@ class BankingCLI:
         self.accounts[acc_number] = {'name': name, 'password': hash_password(password), 'balance': initial_deposit}
         save_accounts(self.accounts, self.accounts_file)
         if initial_deposit > 0:
-            log_transaction(acc_number, 'Deposit', initial_deposit, self.transactions_file)
+            self.record_transaction(acc_number, 'Deposit', initial_deposit)
         print(f'Account created successfully! Account Number: {acc_number}')
 
     def login_cli(self):
@@ -181,11 +407,14 @@ class BankingCLI:
             print('Account not found')
             return
         stored = self.accounts[acc]['password']
-        if stored == hash_password(pw):
+        result = check_password(stored, pw)
+        if result == 'ok':
+            if needs_rehash(stored):
+                change_password(self.accounts, acc, pw, self.accounts_file)
             self.current_account = acc
             print('Login successful')
             self.user_menu()
-        elif is_temp_password(stored, pw):
+        elif result == 'temp':
             print('Logged in with temporary password — you must set a new password now.')
             while True:
                 new_pw = input('Enter new password: ').strip()
@@ -215,7 +444,7 @@ class BankingCLI:
         try:
             while self.current_account:
                 bal = self.accounts[self.current_account]['balance']
-                print(f'\nAccount: {self.current_account} | Balance: {bal:.2f}')
+                print(f'\nAccount: {self.current_account} | Balance: {format_cents(bal)}')
                 print('1. Deposit')
                 print('2. Withdraw')
                 print('3. Transfer')
@@ -234,30 +463,32 @@ class BankingCLI:
                 elif choice == '5':
                     self.show_history()
                 elif choice == '6':
-                    self.current_account = None
+                    self.logout()
                 else:
                     print('Invalid choice')
         except (KeyboardInterrupt, EOFError):
             print('\nLogging out...')
-            self.current_account = None
+            self.logout()
+
+    def logout(self):
+        self.sync()
+        self.current_account = None
 
     def deposit(self):
         try:
-            amt = float(input('Enter amount to deposit: ').strip())
+            amt = to_cents(input('Enter amount to deposit: ').strip())
             if amt <= 0:
                 raise ValueError()
         except Exception:
             print('Invalid amount')
             return
         acc = self.current_account
-        self.accounts[acc]['balance'] += amt
-        save_accounts(self.accounts, self.accounts_file)
-        log_transaction(acc, 'Deposit', amt, self.transactions_file)
-        print(f"Deposit successful, new balance: {self.accounts[acc]['balance']:.2f}")
+        self.post_transactions([(acc, 'Deposit', amt, amt)])
+        print(f"Deposit successful, new balance: {format_cents(self.accounts[acc]['balance'])}")
 
     def withdraw(self):
         try:
-            amt = float(input('Enter amount to withdraw: ').strip())
+            amt = to_cents(input('Enter amount to withdraw: ').strip())
             if amt <= 0:
                 raise ValueError()
         except Exception:
@@ -267,10 +498,8 @@ class BankingCLI:
         if self.accounts[acc]['balance'] < amt:
             print('Insufficient balance')
             return
-        self.accounts[acc]['balance'] -= amt
-        save_accounts(self.accounts, self.accounts_file)
-        log_transaction(acc, 'Withdrawal', amt, self.transactions_file)
-        print(f"Withdrawal successful, new balance: {self.accounts[acc]['balance']:.2f}")
+        self.post_transactions([(acc, 'Withdrawal', amt, -amt)])
+        print(f"Withdrawal successful, new balance: {format_cents(self.accounts[acc]['balance'])}")
 
     def transfer(self):
         to_acc = input('Recipient account number: ').strip()
@@ -278,7 +507,7 @@ class BankingCLI:
             print('Recipient not found')
             return
         try:
-            amt = float(input('Enter amount to transfer: ').strip())
+            amt = to_cents(input('Enter amount to transfer: ').strip())
             if amt <= 0:
                 raise ValueError()
         except Exception:
@@ -287,16 +516,12 @@ class BankingCLI:
         if self.accounts[self.current_account]['balance'] < amt:
             print('Insufficient funds')
             return
-        self.accounts[self.current_account]['balance'] -= amt
-        self.accounts[to_acc]['balance'] += amt
-        save_accounts(self.accounts, self.accounts_file)
-        log_transaction(self.current_account, 'Transfer Out', amt, self.transactions_file)
-        log_transaction(to_acc, 'Transfer In', amt, self.transactions_file)
+        self.post_transactions([(self.current_account, 'Transfer Out', amt, -amt), (to_acc, 'Transfer In', amt, amt)])
         print('Transfer complete')
 
     def change_password_cli(self):
         old_pw = input('Enter current password: ').strip()
-        if self.accounts[self.current_account]['password'] != hash_password(old_pw):
+        if not verify_password(self.accounts[self.current_account]['password'], old_pw):
             print('Incorrect current password')
             return
         new_pw = input('Enter new password: ').strip()
@@ -307,13 +532,13 @@ class BankingCLI:
         print('Password changed')
 
     def show_history(self):
-        txs = get_transactions_for_account(self.current_account, self.transactions_file)
+        txs = self._tx_index.get(self.current_account, [])
         if not txs:
             print('No transactions')
             return
         print('\nTransactions:')
-        for t in txs:
-            print(f"{t.get('Type','')}\t{t.get('Amount','')}\t{t.get('DateTime','')}")
+        for tx_type, amount, when in txs:
+            print(f"{tx_type}\t{amount}\t{when}")
 
     def admin_panel_cli(self):
         pw = input('Enter admin password: ').strip()
@@ -321,8 +546,10 @@ class BankingCLI:
             print('Access denied')
             return
         print('\n--- Admin Panel ---')
-        for acc, data in self.accounts.items():
-            print(f"{acc}: {data['name']} | Balance: {data['balance']:.2f}")
+        if self.accounts:
+            print('\n'.join(f"{acc}: {data['name']} | Balance: {format_cents(data['balance'])}" for acc, data in self.accounts.items()))
+        count, total, largest = account_summary(self.accounts)
+        print(f'Accounts: {count} | Total: {format_cents(total)} | Largest: {format_cents(largest)}')
         action = input('(R)eset password / (D)elete account / Enter to exit: ').strip().lower()
         if action == 'r':
             acc = input('Account number to reset: ').strip()
@@ -337,7 +564,7 @@ class BankingCLI:
                 print(f'Account {acc} deleted')
 
 if TK_AVAILABLE:
-    class BankingGUI:
+    class BankingGUI(_Ledger):
         COLOR_BG = '#f4f7fb'
         COLOR_HEADER = '#2b6cb0'
         COLOR_PRIMARY = '#4299e1'
@@ -345,14 +572,12 @@ if TK_AVAILABLE:
         COLOR_WARN = '#f6ad55'
 
         def __init__(self, root, accounts_file=ACCOUNTS_FILE, transactions_file=TRANSACTIONS_FILE):
+            _import_tk()
             self.root = root
             self.root.title('Banking System')
             self.root.geometry('540x480')
             self.root.configure(bg=self.COLOR_BG)
-            self.accounts_file = accounts_file
-            self.transactions_file = transactions_file
-            ensure_files(self.accounts_file, self.transactions_file)
-            self.accounts = load_accounts(self.accounts_file)
+            self.open_ledger(accounts_file, transactions_file)
             self.current_account = None
             self.build_main_menu()
 
@@ -385,7 +610,7 @@ if TK_AVAILABLE:
                 return
             deposit = simpledialog.askstring('Create Account', 'Enter initial deposit:', parent=self.root)
             try:
-                deposit_val = float(deposit or '0')
+                deposit_val = to_cents(deposit or '0')
                 if deposit_val < 0:
                     raise ValueError()
             except Exception:
@@ -399,7 +624,7 @@ if TK_AVAILABLE:
             self.accounts[acc] = {'name': name, 'password': hash_password(pw), 'balance': deposit_val}
             save_accounts(self.accounts, self.accounts_file)
             if deposit_val > 0:
-                log_transaction(acc, 'Deposit', deposit_val, self.transactions_file)
+                self.record_transaction(acc, 'Deposit', deposit_val)
             messagebox.showinfo('Success', f'Account created! Account number: {acc}')
 
         def login(self):
@@ -411,11 +636,14 @@ if TK_AVAILABLE:
                 messagebox.showerror('Error', 'Account not found')
                 return
             stored_hash = self.accounts[acc]['password']
-            if stored_hash == hash_password(pw):
+            result = check_password(stored_hash, pw)
+            if result == 'ok':
+                if needs_rehash(stored_hash):
+                    change_password(self.accounts, acc, pw, self.accounts_file)
                 self.current_account = acc
                 messagebox.showinfo('Welcome', f'Welcome, {self.accounts[acc]["name"]}!')
                 self.open_dashboard()
-            elif is_temp_password(stored_hash, pw):
+            elif result == 'temp':
                 messagebox.showinfo('Change Password', 'You are using a temporary password — you must set a new password now.')
                 self.force_change_password(acc)
                 self.current_account = acc
@@ -462,7 +690,7 @@ if TK_AVAILABLE:
             body = tk.Frame(self.root, bg=self.COLOR_BG, padx=16, pady=12)
             body.pack(fill='both', expand=True)
 
-            self.balance_var = tk.StringVar(value=f"Balance: {self.accounts[acct]['balance']:.2f}")
+            self.balance_var = tk.StringVar(value=f"Balance: {format_cents(self.accounts[acct]['balance'])}")
             tk.Label(body, textvariable=self.balance_var, bg=self.COLOR_BG, fg='#2d3748', font=('Helvetica', 12, 'bold')).pack(anchor='w')
 
             self.styled_button(body, 'Deposit', self.gui_deposit, bg=self.COLOR_ACCENT).pack(fill='x', pady=6)
@@ -473,29 +701,28 @@ if TK_AVAILABLE:
             self.styled_button(body, 'Logout', self.logout, bg='#e53e3e').pack(fill='x', pady=6)
 
         def logout(self):
+            self.sync()
             self.current_account = None
             self.build_main_menu()
 
         def gui_deposit(self):
             amt = simpledialog.askstring('Deposit', 'Enter amount to deposit:', parent=self.root)
             try:
-                val = float(amt)
+                val = to_cents(amt)
                 if val <= 0:
                     raise ValueError()
             except Exception:
                 messagebox.showerror('Error', 'Invalid amount')
                 return
             acc = self.current_account
-            self.accounts[acc]['balance'] += val
-            save_accounts(self.accounts, self.accounts_file)
-            log_transaction(acc, 'Deposit', val, self.transactions_file)
-            self.balance_var.set(f"Balance: {self.accounts[acc]['balance']:.2f}")
-            messagebox.showinfo('Success', f'Deposited {val:.2f}')
+            self.post_transactions([(acc, 'Deposit', val, val)])
+            self.balance_var.set(f"Balance: {format_cents(self.accounts[acc]['balance'])}")
+            messagebox.showinfo('Success', f'Deposited {format_cents(val)}')
 
         def gui_withdraw(self):
             amt = simpledialog.askstring('Withdraw', 'Enter amount to withdraw:', parent=self.root)
             try:
-                val = float(amt)
+                val = to_cents(amt)
                 if val <= 0:
                     raise ValueError()
             except Exception:
@@ -505,11 +732,9 @@ if TK_AVAILABLE:
             if self.accounts[acc]['balance'] < val:
                 messagebox.showerror('Error', 'Insufficient funds')
                 return
-            self.accounts[acc]['balance'] -= val
-            save_accounts(self.accounts, self.accounts_file)
-            log_transaction(acc, 'Withdrawal', val, self.transactions_file)
-            self.balance_var.set(f"Balance: {self.accounts[acc]['balance']:.2f}")
-            messagebox.showinfo('Success', f'Withdrew {val:.2f}')
+            self.post_transactions([(acc, 'Withdrawal', val, -val)])
+            self.balance_var.set(f"Balance: {format_cents(self.accounts[acc]['balance'])}")
+            messagebox.showinfo('Success', f'Withdrew {format_cents(val)}')
 
         def gui_transfer(self):
             to_acc = simpledialog.askstring('Transfer', 'Recipient account number:', parent=self.root)
@@ -518,7 +743,7 @@ if TK_AVAILABLE:
                 return
             amt = simpledialog.askstring('Transfer', 'Enter amount to transfer:', parent=self.root)
             try:
-                val = float(amt)
+                val = to_cents(amt)
                 if val <= 0:
                     raise ValueError()
             except Exception:
@@ -528,19 +753,15 @@ if TK_AVAILABLE:
             if self.accounts[acc]['balance'] < val:
                 messagebox.showerror('Error', 'Insufficient funds')
                 return
-            self.accounts[acc]['balance'] -= val
-            self.accounts[to_acc]['balance'] += val
-            save_accounts(self.accounts, self.accounts_file)
-            log_transaction(acc, 'Transfer Out', val, self.transactions_file)
-            log_transaction(to_acc, 'Transfer In', val, self.transactions_file)
-            self.balance_var.set(f"Balance: {self.accounts[acc]['balance']:.2f}")
-            messagebox.showinfo('Success', f'Sent {val:.2f} to {to_acc}')
+            self.post_transactions([(acc, 'Transfer Out', val, -val), (to_acc, 'Transfer In', val, val)])
+            self.balance_var.set(f"Balance: {format_cents(self.accounts[acc]['balance'])}")
+            messagebox.showinfo('Success', f'Sent {format_cents(val)} to {to_acc}')
 
         def gui_change_password(self, acc):
             old_pw = simpledialog.askstring('Change Password', 'Enter current password:', show='*', parent=self.root)
             if old_pw is None:
                 return
-            if self.accounts[acc]['password'] != hash_password(old_pw):
+            if not verify_password(self.accounts[acc]['password'], old_pw):
                 messagebox.showerror('Error', 'Incorrect current password')
                 return
             new_pw = simpledialog.askstring('Change Password', 'Enter new password:', show='*', parent=self.root)
@@ -552,7 +773,7 @@ if TK_AVAILABLE:
             messagebox.showinfo('Success', 'Password changed')
 
         def gui_history(self):
-            txs = get_transactions_for_account(self.current_account, self.transactions_file)
+            txs = self._tx_index.get(self.current_account, [])
             win = tk.Toplevel(self.root)
             win.title('Transaction History')
             win.geometry('700x400')
@@ -560,9 +781,24 @@ if TK_AVAILABLE:
             tree = ttk.Treeview(win, columns=cols, show='headings')
             for c in cols:
                 tree.heading(c, text=c)
+            self.fill_tree(tree, list(txs))
             tree.pack(fill='both', expand=True)
-            for row in txs:
-                tree.insert('', 'end', values=(row.get('Type'), row.get('Amount'), row.get('DateTime')))
+
+        def fill_tree(self, tree, rows, chunk=500):
+            # Tk has no multi-row insert, so fill the first chunk before the
+            # tree is packed and the rest from idle callbacks; long lists
+            # then don't block the window while they are materialised.
+            insert = tree.insert
+
+            def fill(start):
+                if not tree.winfo_exists():
+                    return
+                for values in rows[start:start + chunk]:
+                    insert('', 'end', values=values)
+                if start + chunk < len(rows):
+                    tree.after_idle(fill, start + chunk)
+
+            fill(0)
 
         def open_admin_panel(self):
             pw = simpledialog.askstring('Admin Panel', 'Enter admin password:', show='*', parent=self.root)
@@ -576,9 +812,10 @@ if TK_AVAILABLE:
             tree.heading('Account', text='Account')
             tree.heading('Name', text='Name')
             tree.heading('Balance', text='Balance')
+            self.fill_tree(tree, [(acc, data['name'], format_cents(data['balance'])) for acc, data in self.accounts.items()])
             tree.pack(fill='both', expand=True)
-            for acc, data in self.accounts.items():
-                tree.insert('', 'end', values=(acc, data['name'], f"{data['balance']:.2f}"))
+            count, total, largest = account_summary(self.accounts)
+            tk.Label(win, text=f'Accounts: {count} | Total: {format_cents(total)} | Largest: {format_cents(largest)}', font=('Helvetica', 10, 'bold')).pack(anchor='w', padx=8, pady=4)
 
             def reset_selected():
                 sel = tree.selection()
@@ -619,17 +856,137 @@ class BankingCoreTests(unittest.TestCase):
 
     def test_hash_password(self):
         pw = 'secret123'
-        self.assertEqual(hash_password(pw), hashlib.sha256(pw.encode('utf-8')).hexdigest())
+        salt = b'0123456789abcdef'
+        digest = hashlib.pbkdf2_hmac('sha256', pw.encode('utf-8'), salt, PBKDF2_ITERATIONS, 32)
+        expected = f"pbkdf2_sha256${PBKDF2_ITERATIONS}${base64.b64encode(salt).decode('ascii')}${base64.b64encode(digest).decode('ascii')}"
+        self.assertEqual(hash_password(pw, salt), expected)
+        stored = hash_password(pw)
+        self.assertNotEqual(stored, hash_password(pw))
+        self.assertTrue(verify_password(stored, pw))
+        self.assertFalse(verify_password(stored, 'wrong'))
+        self.assertFalse(verify_password('pbkdf2_sha256$1$not base64!$x', pw))
+        for iterations in (0, -1, 10 ** 12):
+            self.assertFalse(verify_password(f'pbkdf2_sha256${iterations}$AAAA$AAAA', pw))
+            self.assertIsNone(check_password(f'pbkdf2_sha256${iterations}$AAAA$AAAA', pw))
+
+    def test_legacy_hashes_still_verify(self):
+        legacy = hashlib.sha256(b'secret123').hexdigest()
+        self.assertTrue(verify_password(legacy, 'secret123'))
+        self.assertTrue(needs_rehash(legacy))
+        self.assertFalse(needs_rehash(hash_password('secret123')))
 
     def test_reset_and_temp_password(self):
         accounts = {}
         acc_id = '999999'
-        accounts[acc_id] = {'name': 'TempUser', 'password': hash_password('orig'), 'balance': 0.0}
+        accounts[acc_id] = {'name': 'TempUser', 'password': hash_password('orig'), 'balance': 0}
         save_accounts(accounts, self.acc_file)
         accounts_loaded = load_accounts(self.acc_file)
         temp = reset_password(accounts_loaded, acc_id, self.acc_file)
         loaded = load_accounts(self.acc_file)
         self.assertTrue(is_temp_password(loaded[acc_id]['password'], temp))
+        self.assertFalse(verify_password(loaded[acc_id]['password'], temp))
+        self.assertIsNone(check_password(loaded[acc_id]['password'], 'orig'))
+        legacy_temp = hashlib.sha256(b'TEMP1234_TEMP').hexdigest()
+        self.assertEqual(check_password(legacy_temp, 'TEMP1234'), 'temp')
+
+    def test_load_accounts_returns_independent_copies(self):
+        save_accounts({'123456': {'name': 'C', 'password': hash_password('pw'), 'balance': 100}}, self.acc_file)
+        first = load_accounts(self.acc_file)
+        first['123456']['balance'] = 0
+        self.assertEqual(load_accounts(self.acc_file)['123456']['balance'], 100)
+        save_accounts({'123456': {'name': 'C', 'password': first['123456']['password'], 'balance': 200}}, self.acc_file)
+        self.assertEqual(load_accounts(self.acc_file)['123456']['balance'], 200)
+
+    def test_header_only_files_load_empty(self):
+        self.assertEqual(load_accounts(self.acc_file), {})
+        self.assertEqual(load_transaction_index(self.tx_file), {})
+        save_accounts({}, self.acc_file)
+        self.assertEqual(load_accounts(self.acc_file), {})
+
+    def test_generate_account_number_when_nearly_full(self):
+        existing = {str(n) for n in range(424200, 424300)} - {'424242'}
+        self.assertEqual(generate_account_number(existing, 424200, 424299), '424242')
+        existing.add('424242')
+        with self.assertRaises(RuntimeError):
+            generate_account_number(existing, 424200, 424299)
+        existing.discard('424250')
+        self.assertEqual(generate_account_number(existing, 424200, 424299), '424250')
+
+    def test_cents_round_trip(self):
+        self.assertEqual(to_cents('0.29'), 29)
+        self.assertEqual(to_cents(12.345), 1235)
+        self.assertEqual(to_cents('+5.25'), 525)
+        for bad in ('abc', 'nan', 'inf', None):
+            with self.assertRaises(ValueError):
+                to_cents(bad)
+        self.assertEqual(format_cents(1205), '12.05')
+        self.assertEqual(format_cents(-5), '-0.05')
+        self.assertEqual(format_cents(0), '0.00')
+
+    def test_account_summary(self):
+        accounts = {'1': {'balance': 1000}, '2': {'balance': 3250}}
+        self.assertEqual(account_summary(accounts), (2, 4250, 3250))
+        self.assertEqual(account_summary({}), (0, 0, 0))
+
+    def test_save_and_load_quoted_name(self):
+        accounts = {'123456': {'name': 'Dey, "S"', 'password': hash_password('pw'), 'balance': 1250}}
+        save_accounts(accounts, self.acc_file)
+        loaded = load_accounts(self.acc_file)
+        self.assertEqual(loaded['123456']['name'], 'Dey, "S"')
+        self.assertEqual(loaded['123456']['balance'], 1250)
+
+    def test_save_and_load_multiline_name(self):
+        accounts = {'123456': {'name': 'A\nB', 'password': hash_password('pw'), 'balance': 100},
+                    '234567': {'name': '"C"\r\nD', 'password': '', 'balance': 200},
+                    '654321': {'name': 'E', 'password': '', 'balance': 300}}
+        save_accounts(accounts, self.acc_file)
+        self.assertEqual(load_accounts(self.acc_file), accounts)
+
+    def test_journal_replay_and_compact(self):
+        accounts = {'123456': {'name': 'J', 'password': hash_password('pw'), 'balance': 1000}}
+        save_accounts(accounts, self.acc_file)
+        with open_journal(self.acc_file) as journal:
+            journal_balance(journal, '123456', 1525)
+            journal_balance(journal, '123456', 1325)
+        loaded = load_accounts(self.acc_file)
+        self.assertEqual(loaded['123456']['balance'], 1325)
+        save_accounts(loaded, self.acc_file)
+        self.assertEqual(os.path.getsize(journal_path(self.acc_file)), 0)
+        self.assertEqual(load_accounts(self.acc_file)['123456']['balance'], 1325)
+
+    def test_journal_replay_after_crash_before_truncate(self):
+        save_accounts({'123456': {'name': 'J', 'password': '', 'balance': 1000}}, self.acc_file)
+        with open_journal(self.acc_file) as journal:
+            journal_balance(journal, '123456', 1500)
+        # Install the compacted snapshot but die before the journal is emptied.
+        _write_csv_atomic(self.acc_file, ACCOUNTS_HEADER, ['123456,J,,15.00'])
+        _load_accounts_cached.cache_clear()
+        self.assertGreater(os.path.getsize(journal_path(self.acc_file)), 0)
+        self.assertEqual(load_accounts(self.acc_file)['123456']['balance'], 1500)
+
+    def test_batched_writes_replay_like_single_writes(self):
+        save_accounts({'111111': {'name': 'A', 'password': '', 'balance': 1000}, '222222': {'name': 'B', 'password': '', 'balance': 0}}, self.acc_file)
+        with open_journal(self.acc_file) as journal:
+            journal_balances(journal, [('111111', 750), ('222222', 250)])
+        log = open_transaction_log(self.tx_file)
+        try:
+            rows = write_transactions(log, [('111111', 'Transfer Out', 250), ('222222', 'Transfer In', 250)])
+        finally:
+            os.close(log)
+        loaded = load_accounts(self.acc_file)
+        self.assertEqual((loaded['111111']['balance'], loaded['222222']['balance']), (750, 250))
+        index = load_transaction_index(self.tx_file)
+        self.assertEqual(index['111111'], [rows[0]])
+        self.assertEqual(index['222222'], [rows[1]])
+
+    def test_transaction_index_matches_log(self):
+        log_transaction('111111', 'Deposit', 1000, self.tx_file)
+        log_transaction('222222', 'Deposit', 2000, self.tx_file)
+        log_transaction('111111', 'Withdrawal', 500, self.tx_file)
+        index = load_transaction_index(self.tx_file)
+        self.assertEqual([t[:2] for t in index['111111']], [('Deposit', '10.00'), ('Withdrawal', '5.00')])
+        self.assertEqual(len(index['111111']), len(get_transactions_for_account('111111', self.tx_file)))
+        datetime.strptime(index['111111'][0][2], '%Y-%m-%d %H:%M:%S')
         
     from datetime import datetime  # already imported
 
@@ -661,35 +1018,56 @@ def main_menu(self):
         print('\nExiting...')
 
 
-def run_tests():
-    loader = unittest.TestLoader()
-    suite = loader.loadTestsFromTestCase(BankingCoreTests)
-    runner = unittest.TextTestRunner(verbosity=2)
+@functools.lru_cache(maxsize=None)
+def _test_names() -> tuple:
+    return tuple(unittest.TestLoader().getTestCaseNames(BankingCoreTests))
+
+def run_tests(verbosity=1):
+    # A TestSuite drops its tests as it runs them, so only the discovered
+    # names are cached and a fresh suite is built per call.
+    suite = unittest.TestSuite(map(BankingCoreTests, _test_names()))
+    runner = unittest.TextTestRunner(verbosity=verbosity)
     return runner.run(suite)
 
+OPTIONS = ('--cli', '--gui', '--test', '-v')
+
+def _parse_args(argv) -> set:
+    usage = f"usage: {os.path.basename(sys.argv[0])} [-h] [--cli] [--gui] [--test [-v]]"
+    flags = set(argv)
+    if '-h' in flags or '--help' in flags:
+        print(usage)
+        print('\noptions:\n  -h, --help  show this help message and exit\n  --cli       run the command-line interface\n  --gui       run the Tkinter interface (default when available)\n  --test      run the unit tests\n  -v          with --test, list each test as it runs')
+        sys.exit(0)
+    unknown = [a for a in argv if a not in OPTIONS]
+    if unknown:
+        print(usage, file=sys.stderr)
+        print(f"error: unrecognized arguments: {' '.join(unknown)}", file=sys.stderr)
+        sys.exit(2)
+    return flags
+
 def main():
-    parser = argparse.ArgumentParser()
-    parser.add_argument('--cli', action='store_true')
-    parser.add_argument('--gui', action='store_true')
-    parser.add_argument('--test', action='store_true')
-    args = parser.parse_args()
-
-    if args.test:
-        run_tests()
-        return
+    flags = _parse_args(sys.argv[1:])
 
-    if args.cli or not TK_AVAILABLE:
-        BankingCLI().main_menu()
+    if '--test' in flags:
+        run_tests(2 if '-v' in flags else 1)
         return
 
-    if args.gui and not TK_AVAILABLE:
-        print('Tkinter not available — falling back to CLI')
-        BankingCLI().main_menu()
+    if '--cli' in flags or not _import_tk():
+        if '--gui' in flags and not TK_AVAILABLE:
+            print('Tkinter not available — falling back to CLI')
+        cli = BankingCLI()
+        try:
+            cli.main_menu()
+        finally:
+            cli.close()
         return
 
     root = tk.Tk()
     app = BankingGUI(root)
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        app.close()
 
 if __name__ == '__main__':
     main()
\ No newline at end of file